@@ -3,10 +3,10 @@
 Bronze -> Silver transform for sensor_readings.
 
 Reads:
-- lake/bronze/YYYY-MM-DD/sensor_readings.jsonl
+- lake/bronze/YYYY-MM-DD/sensor_readings.jsonl (or sensor_readings.jsonl.gz)
 
 Writes:
-- lake/silver/YYYY-MM-DD/sensor_readings_clean.csv
+- lake/silver/YYYY-MM-DD/sensor_readings_clean.csv (or sensor_readings_clean.csv.gz with --silver-format csv.gz)
 - lake/quarantine/YYYY-MM-DD/sensor_readings_rejects.csv
 - reports/dq_YYYY-MM-DD.md
 
@@ -17,92 +17,221 @@ from __future__ import annotations
 
 import argparse
 import csv
+import gzip
+import io
 import json
+import os
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+# Rows formatted per f.write() when writing CSV outputs
+CSV_BATCH_ROWS = 4096
+
+# Bytes per read() from the bronze input
+READ_BUFFER_BYTES = 1 << 20
+
+# Sensor reading columns. Rows are validated and written as value tuples in this order.
+SENSOR_FIELDS = (
+    "reading_id", "asset_id", "ts_utc",
+    "temperature_c", "vibration_mm_s", "pressure_bar", "flow_l_min", "rpm",
+    "operating_state", "sample_interval_sec",
+)
+_sensor_values = itemgetter(*SENSOR_FIELDS)
 
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Transform bronze sensor readings to silver with validation + quarantine.")
     p.add_argument("--date", required=True, help="YYYY-MM-DD (must exist under lake/bronze/)")
+    p.add_argument(
+        "--silver-format",
+        choices=["csv", "csv.gz"],
+        default="csv",
+        help="Silver readings file format; csv.gz is gzip-compressed (default: csv)",
+    )
     return p.parse_args()
 
 
-def is_iso_utc_z(ts: str) -> bool:
-    # simple check for ISO UTC like 2026-02-02T12:30:00Z
-    return isinstance(ts, str) and ts.endswith("Z") and "T" in ts
+# Reject reasons, in reject_reason order. Bit i of a reason mask stands for REASONS[i].
+REASONS = (
+    "missing_reading_id",
+    "missing_asset_id",
+    "bad_ts_utc",
+    "temperature_out_of_range",
+    "vibration_out_of_range",
+    "pressure_out_of_range",
+    "flow_out_of_range",
+    "rpm_out_of_range",
+    "duplicate_reading_id",  # set by the dedup pass, never by reason_mask()
+)
+DUPLICATE_MASK = 1 << 8
+
+# Numeric range checks (very basic but realistic): (SENSOR_FIELDS index, lo, hi, reason bit).
+# These are not "physics perfect"; they are sanity checks.
+RANGE_CHECKS = (
+    (3, -40.0, 200.0, 1 << 3),  # temperature_c: -40 to 200 C
+    (4, 0.0, 50.0, 1 << 4),  # vibration_mm_s: 0 to 50 mm/s
+    (5, 0.0, 50.0, 1 << 5),  # pressure_bar: 0 to 50 bar
+    (6, 0.0, 5000.0, 1 << 6),  # flow_l_min: 0 to 5000 L/min
+    (7, 0.0, 20000.0, 1 << 7),  # rpm: 0 to 20000
+)
+
+_MASK_REASONS: Dict[int, Tuple[str, ...]] = {}
+
+
+def sensor_values(r: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Row values in SENSOR_FIELDS order, fetched with one C-level itemgetter call
+    (missing keys -> None on the slow path).
+    """
+    try:
+        return _sensor_values(r)
+    except KeyError:
+        return tuple([r.get(fn) for fn in SENSOR_FIELDS])
 
 
-def validate_row(r: Dict[str, Any]) -> Tuple[bool, List[str]]:
+def reason_mask(values: Tuple[Any, ...]) -> int:
     """
-    Validate a sensor reading row. Return (is_valid, reasons[]).
+    Validate sensor reading values (SENSOR_FIELDS order).
+    Return a bitmask of failed checks (0 = valid).
     """
-    reasons: List[str] = []
-
-    reading_id = (r.get("reading_id") or "").strip()
-    asset_id = (r.get("asset_id") or "").strip()
-    ts_utc = r.get("ts_utc")
+    mask = 0
 
     # Required fields
-    if not reading_id:
-        reasons.append("missing_reading_id")
-    if not asset_id:
-        reasons.append("missing_asset_id")
-    if not ts_utc or not is_iso_utc_z(ts_utc):
-        reasons.append("bad_ts_utc")
-
-    # Numeric range checks (very basic but realistic)
-    # These are not "physics perfect"; they are sanity checks.
-    def as_float(x: Any) -> float:
+    if not (values[0] or "").strip():
+        mask |= 1
+    if not (values[1] or "").strip():
+        mask |= 2
+    ts_utc = values[2]
+    # Simple check for ISO UTC like 2026-02-02T12:30:00Z: a string with a "T" that
+    # ends in "Z" (an empty or missing value fails it too)
+    if not (isinstance(ts_utc, str) and ts_utc.endswith("Z") and "T" in ts_utc):
+        mask |= 4
+
+    for i, lo, hi, bit in RANGE_CHECKS:
         try:
-            return float(x)
+            v = float(values[i])
         except Exception:
-            return float("nan")
-
-    temperature = as_float(r.get("temperature_c"))
-    vibration = as_float(r.get("vibration_mm_s"))
-    pressure = as_float(r.get("pressure_bar"))
-    flow = as_float(r.get("flow_l_min"))
-    rpm = as_float(r.get("rpm"))
-
-    # Temperature sanity: -40 to 200 C
-    if not (-40.0 <= temperature <= 200.0):
-        reasons.append("temperature_out_of_range")
-    # Vibration sanity: 0 to 50 mm/s
-    if not (0.0 <= vibration <= 50.0):
-        reasons.append("vibration_out_of_range")
-    # Pressure sanity: 0 to 50 bar
-    if not (0.0 <= pressure <= 50.0):
-        reasons.append("pressure_out_of_range")
-    # Flow sanity: 0 to 5000 L/min
-    if not (0.0 <= flow <= 5000.0):
-        reasons.append("flow_out_of_range")
-    # RPM sanity: 0 to 20000
-    if not (0.0 <= rpm <= 20000.0):
-        reasons.append("rpm_out_of_range")
-
-    return (len(reasons) == 0, reasons)
-
-
-def load_jsonl(path: Path) -> List[Dict[str, Any]]:
-    rows: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            rows.append(json.loads(line))
-    return rows
-
-
-def write_csv(path: Path, fieldnames: List[str], rows: List[Dict[str, Any]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            w.writerow(r)
+            mask |= bit
+            continue
+        if not (lo <= v <= hi):
+            mask |= bit
+
+    return mask
+
+
+def mask_reasons(mask: int) -> Tuple[str, ...]:
+    """Decode a reason mask into reason codes (cached per distinct mask)."""
+    reasons = _MASK_REASONS.get(mask)
+    if reasons is None:
+        reasons = tuple(reason for i, reason in enumerate(REASONS) if mask >> i & 1)
+        _MASK_REASONS[mask] = reasons
+    return reasons
+
+
+def tally_reasons(mask_counts: Dict[int, int]) -> Dict[str, int]:
+    """
+    Expand per-mask reject counts into per-reason counts. Reasons come out in the
+    order they were first seen, as if they had been counted row by row.
+    """
+    counts: Dict[str, int] = {}
+    for mask, n in mask_counts.items():
+        for reason in mask_reasons(mask):
+            counts[reason] = counts.get(reason, 0) + n
+    return counts
+
+
+def iter_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield one parsed row per non-empty line, without holding the file in memory."""
+    with path.open("rb", buffering=READ_BUFFER_BYTES) as raw:
+        if hasattr(os, "posix_fadvise"):
+            # Sequential hint: the kernel widens readahead so reads rarely block on the disk
+            os.posix_fadvise(raw.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if path.suffix == ".gz":
+            f = gzip.open(raw, "rt", encoding="utf-8")
+        else:
+            f = io.TextIOWrapper(raw, encoding="utf-8")
+        with f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                yield json.loads(line)
+
+
+class CsvBatchWriter:
+    """
+    Incremental CSV writer for value rows (same output as csv.writer).
+    Plain rows are joined directly and flushed in batches of CSV_BATCH_ROWS;
+    rows with a delimiter, quote or newline inside a value go through csv.writer.
+    A .gz path is gzip-compressed.
+
+    Rows go to <path>.tmp, which is renamed over path only when the writer closes
+    normally; leaving the with-block on an exception deletes it instead, so a
+    failed run never leaves a partial output that looks complete.
+    """
+
+    def __init__(self, path: Path, fieldnames: List[str]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.fieldnames = fieldnames
+        self.rows = 0
+        self._last_sep = len(fieldnames) - 1
+        self._buf: List[str] = []
+        self._tmp_path = path.with_name(path.name + ".tmp")
+        self._raw = self._tmp_path.open("wb")
+        if path.suffix == ".gz":
+            # filename= keeps the final name (not .tmp) in the gzip header
+            gz = gzip.GzipFile(filename=path.name, mode="wb", compresslevel=6, fileobj=self._raw)
+            self._f = io.TextIOWrapper(gz, newline="", encoding="utf-8")
+        else:
+            self._f = io.TextIOWrapper(self._raw, newline="", encoding="utf-8")
+        self._w = csv.writer(self._f)
+        self._w.writerow(fieldnames)
+
+    def __enter__(self) -> "CsvBatchWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def writevalues(self, values: Sequence[Any]) -> None:
+        """Write one row given as values in fieldnames order."""
+        self.rows += 1
+        cells = ["" if v is None else str(v) for v in values]
+        line = ",".join(cells)
+        if line.count(",") == self._last_sep and '"' not in line and "\n" not in line and "\r" not in line:
+            self._buf.append(line)
+            if len(self._buf) >= CSV_BATCH_ROWS:
+                self.flush()
+            return
+        # Value needs quoting: keep row order and let csv handle it
+        self.flush()
+        self._w.writerow(cells)
+
+    def flush(self) -> None:
+        if self._buf:
+            self._f.write("\r\n".join(self._buf) + "\r\n")
+            self._buf.clear()
+
+    def close(self) -> None:
+        """Finish the file and move it into place."""
+        self.flush()
+        self._f.close()
+        self._raw.close()
+        os.replace(self._tmp_path, self.path)
+
+    def discard(self) -> None:
+        """Drop the partial output; an existing file at path is left untouched."""
+        try:
+            self._f.close()
+            self._raw.close()
+        finally:
+            self._tmp_path.unlink(missing_ok=True)
 
 
 def write_dq_report(path: Path, date_str: str, stats: Dict[str, Any]) -> None:
@@ -127,71 +256,74 @@ def main() -> int:
 
     bronze_dir = Path("lake") / "bronze" / date_str
     in_path = bronze_dir / "sensor_readings.jsonl"
+    gz_path = bronze_dir / "sensor_readings.jsonl.gz"
+    if in_path.exists() and gz_path.exists():
+        raise FileExistsError(f"Ambiguous input, both exist (remove the stale one): {in_path}, {gz_path}")
     if not in_path.exists():
-        raise FileNotFoundError(f"Missing input: {in_path}")
-
-    rows = load_jsonl(in_path)
-
-    seen_ids = set()
-    clean_rows: List[Dict[str, Any]] = []
-    reject_rows: List[Dict[str, Any]] = []
-
-    reason_counts: Dict[str, int] = {}
-    dup_rejects = 0
-
-    for r in rows:
-        reading_id = (r.get("reading_id") or "").strip()
-
-        # De-duplication by reading_id
-        if reading_id and reading_id in seen_ids:
-            dup_rejects += 1
-            rr = dict(r)
-            rr["reject_reason"] = "duplicate_reading_id"
-            reject_rows.append(rr)
-            reason_counts["duplicate_reading_id"] = reason_counts.get("duplicate_reading_id", 0) + 1
-            continue
-
-        if reading_id:
-            seen_ids.add(reading_id)
-
-        valid, reasons = validate_row(r)
-        if valid:
-            clean_rows.append(r)
-        else:
-            rr = dict(r)
-            rr["reject_reason"] = "|".join(reasons)
-            reject_rows.append(rr)
-            for reason in reasons:
-                reason_counts[reason] = reason_counts.get(reason, 0) + 1
+        if not gz_path.exists():
+            raise FileNotFoundError(f"Missing input: {in_path}")
+        in_path = gz_path
 
     # Output paths
     silver_dir = Path("lake") / "silver" / date_str
     quarantine_dir = Path("lake") / "quarantine" / date_str
     reports_dir = Path("reports")
 
-    clean_fields = [
-        "reading_id", "asset_id", "ts_utc",
-        "temperature_c", "vibration_mm_s", "pressure_bar", "flow_l_min", "rpm",
-        "operating_state", "sample_interval_sec"
-    ]
+    clean_path = silver_dir / f"sensor_readings_clean.{args.silver_format}"
+    clean_fields = list(SENSOR_FIELDS)
     reject_fields = clean_fields + ["reject_reason"]
 
-    write_csv(silver_dir / "sensor_readings_clean.csv", clean_fields, clean_rows)
-    write_csv(quarantine_dir / "sensor_readings_rejects.csv", reject_fields, reject_rows)
+    seen_ids = set()
+    seen_add = seen_ids.add
+    total = 0
+    # Rejects are tallied per distinct reason mask (a handful of keys) and expanded
+    # into per-reason counts once at the end
+    mask_counts: Dict[int, int] = {}
+
+    # Single pass: each row is validated and written as soon as it is read
+    with CsvBatchWriter(clean_path, clean_fields) as clean_out, \
+            CsvBatchWriter(quarantine_dir / "sensor_readings_rejects.csv", reject_fields) as reject_out:
+        for r in iter_jsonl(in_path):
+            total += 1
+            values = sensor_values(r)
+            reading_id = (values[0] or "").strip()
+
+            # De-duplication by reading_id: a single set.add() both records the id and,
+            # if the set did not grow, tells us it was already seen
+            if reading_id:
+                n_seen = len(seen_ids)
+                seen_add(reading_id)
+                if len(seen_ids) == n_seen:
+                    reject_out.writevalues(values + ("duplicate_reading_id",))
+                    mask_counts[DUPLICATE_MASK] = mask_counts.get(DUPLICATE_MASK, 0) + 1
+                    continue
+
+            mask = reason_mask(values)
+            if not mask:
+                clean_out.writevalues(values)
+            else:
+                reject_out.writevalues(values + ("|".join(mask_reasons(mask)),))
+                mask_counts[mask] = mask_counts.get(mask, 0) + 1
+
+    # Drop the other format left by an earlier run, so silver_to_gold never reads stale data
+    other_format = "csv.gz" if args.silver_format == "csv" else "csv"
+    (silver_dir / f"sensor_readings_clean.{other_format}").unlink(missing_ok=True)
+
+    reason_counts = tally_reasons(mask_counts)
 
     stats = {
-        "total": len(rows),
-        "clean": len(clean_rows),
-        "rejects": len(reject_rows),
-        "dup_rejects": dup_rejects,
+        "total": total,
+        "clean": clean_out.rows,
+        "rejects": reject_out.rows,
+        "dup_rejects": mask_counts.get(DUPLICATE_MASK, 0),
         "reasons": dict(sorted(reason_counts.items(), key=lambda kv: kv[1], reverse=True)),
     }
 
     write_dq_report(reports_dir / f"dq_{date_str}.md", date_str, stats)
 
     print(f"Read: {in_path}")
-    print(f"Silver: {silver_dir / 'sensor_readings_clean.csv'}  ({len(clean_rows)} rows)")
-    print(f"Quarantine: {quarantine_dir / 'sensor_readings_rejects.csv'}  ({len(reject_rows)} rows)")
+    print(f"Silver: {clean_path}  ({clean_out.rows} rows)")
+    print(f"Quarantine: {quarantine_dir / 'sensor_readings_rejects.csv'}  ({reject_out.rows} rows)")
     print(f"DQ report: {reports_dir / f'dq_{date_str}.md'}")
     return 0
 
@@ -5,7 +5,7 @@ Generate synthetic industrial operations data into lake/bronze/YYYY-MM-DD/.
 Outputs (Bronze - raw landed):
 - plants.csv
 - assets.csv
-- sensor_readings.jsonl
+- sensor_readings.jsonl (or sensor_readings.jsonl.gz with --sensor-format jsonl.gz)
 - work_orders.csv
 - quality_inspections.csv
 - generation_meta.json
@@ -17,12 +17,42 @@ from __future__ import annotations
 
 import argparse
 import csv
+import gzip
+import io
 import json
+import os
+import queue
 import random
-from dataclasses import dataclass
+import threading
+from bisect import bisect
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, date, timedelta, timezone
+from itertools import accumulate
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+# Rows formatted per chunk when writing CSV outputs
+WRITE_BATCH_ROWS = 4096
+
+# Assets per task with --workers > 1: small tasks keep only a few chunks of JSONL
+# text in memory at a time, whatever the total sensor volume
+SENSOR_TASK_ASSETS = 4
+
+# Sensor readings are fixed-schema tuples in this field order
+SENSOR_FIELDS = (
+    "reading_id", "asset_id", "ts_utc",
+    "temperature_c", "vibration_mm_s", "pressure_bar", "flow_l_min", "rpm",
+    "operating_state", "sample_interval_sec",
+)
+
+# One sensor reading as a JSONL line, byte-identical to json.dumps() of the row dict.
+# String fields are generated IDs/codes/timestamps and never need JSON escaping.
+SENSOR_JSONL_TEMPLATE = (
+    '{{"reading_id": "{}", "asset_id": "{}", "ts_utc": "{}", '
+    '"temperature_c": {}, "vibration_mm_s": {}, "pressure_bar": {}, "flow_l_min": {}, "rpm": {}, '
+    '"operating_state": "{}", "sample_interval_sec": {}}}\n'
+)
 
 
 # ----------------------------
@@ -52,8 +82,7 @@ def maybe_null(rng: random.Random, value: Any, p_null: float) -> Any:
 # Data models
 # ----------------------------
 
-@dataclass
-class Plant:
+class Plant(NamedTuple):
     plant_id: str
     plant_name: str
     country: str
@@ -61,8 +90,7 @@ class Plant:
     line_count: int
 
 
-@dataclass
-class Asset:
+class Asset(NamedTuple):
     asset_id: str
     plant_id: str
     asset_type: str
@@ -161,95 +189,202 @@ def base_signals_for(asset_type: str) -> Dict[str, float]:
     return {"temperature_c": 42, "vibration_mm_s": 1.0, "pressure_bar": 0.0, "flow_l_min": 0.0, "rpm": 120}
 
 
+def new_sensor_counters() -> Dict[str, int]:
+    return {"total": 0, "bad_missing_asset_id": 0, "bad_out_of_range": 0, "bad_duplicate_id": 0}
+
+
+def format_sensor_jsonl(rows: List[Tuple[Any, ...]]) -> str:
+    fmt = SENSOR_JSONL_TEMPLATE.format
+    return "".join([fmt(*r) for r in rows])
+
+
 def generate_sensor_readings(
     rng: random.Random,
     assets: List[Asset],
     day: date,
     sample_minutes: int,
     bad_rate: float,
-) -> (List[Dict[str, Any]], Dict[str, int]):
+    out: Callable[[str], None],
+    workers: int = 1,
+) -> Dict[str, int]:
     """
-    Generate JSONL-friendly dict rows.
+    Generate sensor readings and hand them to `out` as JSONL text, chunk by chunk
+    and in reading_id order, so rows never accumulate in memory. Returns counters.
     We'll inject a small fraction of "bad" rows: missing asset_id, impossible values, duplicate IDs.
+
+    With workers > 1, assets are split into contiguous SENSOR_TASK_ASSETS chunks
+    generated in separate processes, each from its own stream seeded by rng. At most
+    `workers` chunks are in flight, and each is released once handed to `out`. Output
+    is deterministic for a given seed (the same for any workers > 1), but differs from
+    the single-stream workers=1 data.
     """
     start = datetime(day.year, day.month, day.day, 0, 0, 0, tzinfo=timezone.utc)
     steps = int((24 * 60) / sample_minutes)
 
-    rows: List[Dict[str, Any]] = []
-    counters = {"total": 0, "bad_missing_asset_id": 0, "bad_out_of_range": 0, "bad_duplicate_id": 0}
+    # Every asset shares the same sample timestamps; format them once
+    ts_strs = [iso_utc(start + timedelta(minutes=sample_minutes * s)) for s in range(steps)]
+
+    counters = new_sensor_counters()
+    if workers <= 1 or len(assets) <= 1:
+        for rows in iter_sensor_chunk(rng, assets, ts_strs, sample_minutes, bad_rate, 1, counters):
+            out(format_sensor_jsonl(rows))
+        return counters
+
+    def emit(fut: "Future[Tuple[str, Dict[str, int]]]") -> None:
+        text, chunk_counters = fut.result()
+        out(text)
+        for k, v in chunk_counters.items():
+            counters[k] += v
+
+    pending: "Deque[Future[Tuple[str, Dict[str, int]]]]" = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for i in range(0, len(assets), SENSOR_TASK_ASSETS):
+            if len(pending) >= workers:
+                emit(pending.popleft())
+            pending.append(
+                pool.submit(
+                    generate_sensor_jsonl_seeded,
+                    rng.getrandbits(64),
+                    assets[i:i + SENSOR_TASK_ASSETS],
+                    ts_strs,
+                    sample_minutes,
+                    bad_rate,
+                    i * steps + 1,  # reading_ids stay globally sequential
+                )
+            )
+        while pending:
+            emit(pending.popleft())
+    return counters
+
 
-    reading_seq = 1
+def generate_sensor_jsonl_seeded(
+    seed: int,
+    assets: List[Asset],
+    ts_strs: List[str],
+    sample_minutes: int,
+    bad_rate: float,
+    first_seq: int,
+) -> Tuple[str, Dict[str, int]]:
+    """Process-pool entry point: one asset chunk from its own seeded rng, as JSONL text."""
+    counters = new_sensor_counters()
+    chunks = iter_sensor_chunk(random.Random(seed), assets, ts_strs, sample_minutes, bad_rate, first_seq, counters)
+    return "".join([format_sensor_jsonl(rows) for rows in chunks]), counters
+
+
+def iter_sensor_chunk(
+    rng: random.Random,
+    assets: List[Asset],
+    ts_strs: List[str],
+    sample_minutes: int,
+    bad_rate: float,
+    first_seq: int,
+    counters: Dict[str, int],
+) -> Iterator[List[Tuple[Any, ...]]]:
+    """
+    Yield one list of sensor reading tuples (SENSOR_FIELDS order) per asset, at the
+    given timestamps, numbering reading_ids from first_seq. Updates counters in place.
+    """
+    reading_seq = first_seq
     duplicate_id: Optional[str] = None
 
+    # The per-sample draws below are rng.choices()/rng.uniform() inlined over a bound
+    # rng.random: uniform(a, b) is a + (b - a) * random(), and the state pick is the
+    # same cumulative-weight bisect choices() does, so the random stream is unchanged.
+    random_ = rng.random
+    states = ["running", "idle", "off"]
+    state_cum_weights = list(accumulate([0.78, 0.15, 0.07]))
+    state_total = state_cum_weights[-1] + 0.0
+    bad_types = ["missing_asset_id", "out_of_range", "duplicate_id"]
+    bad_cum_weights = list(accumulate([0.35, 0.45, 0.20]))
+    bad_total = bad_cum_weights[-1] + 0.0
+
     for asset in assets:
         base = base_signals_for(asset.asset_type)
         # Simple degradation factor: some assets run "rougher"
         roughness = rng.uniform(0.85, 1.25)
-
-        for s in range(steps):
-            ts = start + timedelta(minutes=sample_minutes * s)
-
+        rows: List[Tuple[Any, ...]] = []
+
+        # Per-state signal baselines are fixed for the asset; scale them once here
+        temp_off = base["temperature_c"] * 0.7
+        temp_idle = base["temperature_c"] * 0.9
+        vib_idle = base["vibration_mm_s"] * 0.6
+        rpm_idle = base["rpm"] * 0.35
+        temp_running = base["temperature_c"] * roughness
+        vib_running = base["vibration_mm_s"] * roughness
+        rpm_running = base["rpm"] * clamp(roughness, 0.9, 1.15)
+        pressure_running = base["pressure_bar"] * 1.0
+        pressure_stopped = base["pressure_bar"] * 0.2
+        flow_running = base["flow_l_min"] * 1.0
+        flow_stopped = base["flow_l_min"] * 0.1
+
+        for ts_utc in ts_strs:
             # operating state distribution
-            state = rand_choice(rng, ["running", "idle", "off"], weights=[0.78, 0.15, 0.07])
+            state = states[bisect(state_cum_weights, random_() * state_total, 0, 2)]
+            # (draw order per sample: temp, vib, [rpm], pressure, flow)
             if state == "off":
                 # mostly zeros when off
-                temp = base["temperature_c"] * 0.7 + rng.uniform(-1, 1)
-                vib = rng.uniform(0.0, 0.3)
+                temp = temp_off + (-1 + 2 * random_())
+                vib = 0.0 + 0.3 * random_()
                 rpm = 0.0
+                pressure = pressure_stopped + (-0.3 + 0.6 * random_())
+                flow = flow_stopped + (-5 + 10 * random_())
             elif state == "idle":
-                temp = base["temperature_c"] * 0.9 + rng.uniform(-2, 2)
-                vib = base["vibration_mm_s"] * 0.6 + rng.uniform(-0.3, 0.3)
-                rpm = base["rpm"] * 0.35 + rng.uniform(-50, 50)
+                temp = temp_idle + (-2 + 4 * random_())
+                vib = vib_idle + (-0.3 + 0.6 * random_())
+                rpm = rpm_idle + (-50 + 100 * random_())
+                pressure = pressure_stopped + (-0.3 + 0.6 * random_())
+                flow = flow_stopped + (-5 + 10 * random_())
             else:
-                temp = base["temperature_c"] * roughness + rng.uniform(-3, 3)
-                vib = base["vibration_mm_s"] * roughness + rng.uniform(-0.6, 0.6)
-                rpm = base["rpm"] * clamp(roughness, 0.9, 1.15) + rng.uniform(-80, 80)
-
-            pressure = base["pressure_bar"] * (1.0 if state == "running" else 0.2) + rng.uniform(-0.3, 0.3)
-            flow = base["flow_l_min"] * (1.0 if state == "running" else 0.1) + rng.uniform(-5, 5)
+                temp = temp_running + (-3 + 6 * random_())
+                vib = vib_running + (-0.6 + 1.2 * random_())
+                rpm = rpm_running + (-80 + 160 * random_())
+                pressure = pressure_running + (-0.3 + 0.6 * random_())
+                flow = flow_running + (-5 + 10 * random_())
 
-            # Build row
             reading_id = f"RDG-{reading_seq:08d}"
             reading_seq += 1
-
-            row: Dict[str, Any] = {
-                "reading_id": reading_id,
-                "asset_id": asset.asset_id,
-                "ts_utc": iso_utc(ts),
-                "temperature_c": round(temp, 2),
-                "vibration_mm_s": round(max(0.0, vib), 3),
-                "pressure_bar": round(max(0.0, pressure), 3),
-                "flow_l_min": round(max(0.0, flow), 2),
-                "rpm": int(max(0.0, rpm)),
-                "operating_state": state,
-                "sample_interval_sec": sample_minutes * 60,
-            }
+            asset_id = asset.asset_id
+            temperature_c = round(temp, 2)
+            pressure_bar = round(max(0.0, pressure), 3)
 
             # Inject controlled "bad" data
-            if rng.random() < bad_rate:
-                bad_type = rand_choice(rng, ["missing_asset_id", "out_of_range", "duplicate_id"], weights=[0.35, 0.45, 0.20])
+            if random_() < bad_rate:
+                bad_type = bad_types[bisect(bad_cum_weights, random_() * bad_total, 0, 2)]
                 if bad_type == "missing_asset_id":
-                    row["asset_id"] = ""  # missing required ID
+                    asset_id = ""  # missing required ID
                     counters["bad_missing_asset_id"] += 1
                 elif bad_type == "out_of_range":
                     # make an impossible value (negative pressure OR extreme temp)
                     if rng.random() < 0.5:
-                        row["pressure_bar"] = -3.0
+                        pressure_bar = -3.0
                     else:
-                        row["temperature_c"] = 250.0
+                        temperature_c = 250.0
                     counters["bad_out_of_range"] += 1
                 else:
                     # duplicate reading_id
                     if duplicate_id is None:
-                        duplicate_id = row["reading_id"]
+                        duplicate_id = reading_id
                     else:
-                        row["reading_id"] = duplicate_id
+                        reading_id = duplicate_id
                     counters["bad_duplicate_id"] += 1
 
-            rows.append(row)
-            counters["total"] += 1
+            rows.append(
+                (
+                    reading_id,
+                    asset_id,
+                    ts_utc,
+                    temperature_c,
+                    round(max(0.0, vib), 3),
+                    pressure_bar,
+                    round(max(0.0, flow), 2),
+                    int(max(0.0, rpm)),
+                    state,
+                    sample_minutes * 60,
+                )
+            )
 
-    return rows, counters
+        counters["total"] += len(rows)
+        yield rows
 
 
 def generate_work_orders(rng: random.Random, assets: List[Asset], day: date) -> List[Dict[str, Any]]:
@@ -335,20 +470,125 @@ def generate_quality_inspections(rng: random.Random, plants: List[Plant], day: d
     return rows
 
 
-def write_csv(path: Path, rows: List[Dict[str, Any]], fieldnames: List[str]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            w.writerow(r)
+def iter_csv_chunks(rows: Iterable[Sequence[Any]], fieldnames: Sequence[str]) -> Iterator[str]:
+    """
+    Yield CSV text for value rows in fieldnames order (same output as csv.writer),
+    header first, in chunks of up to WRITE_BATCH_ROWS rows.
+    Plain rows are joined directly; rows with a delimiter, quote or newline inside
+    a value go through csv.writer.
+    """
+    quoted = io.StringIO()
+    w = csv.writer(quoted)
+    w.writerow(fieldnames)
+    buf: List[str] = [quoted.getvalue()]
+    last_sep = len(fieldnames) - 1
+    for values in rows:
+        cells = ["" if v is None else str(v) for v in values]
+        line = ",".join(cells)
+        if line.count(",") == last_sep and '"' not in line and "\n" not in line and "\r" not in line:
+            buf.append(line + "\r\n")
+        else:
+            quoted.seek(0)
+            quoted.truncate()
+            w.writerow(cells)
+            buf.append(quoted.getvalue())
+        if len(buf) >= WRITE_BATCH_ROWS:
+            yield "".join(buf)
+            buf.clear()
+    if buf:
+        yield "".join(buf)
+
+
+def row_values(rows: Iterable[Dict[str, Any]], fieldnames: Sequence[str]) -> Iterator[List[Any]]:
+    """Dict rows as value lists in fieldnames order (missing keys become empty cells)."""
+    for r in rows:
+        yield [r.get(fn) for fn in fieldnames]
+
+
+def write_csv_tables(tables: List[Tuple[Path, Iterable[Sequence[Any]], Sequence[str]]]) -> None:
+    """
+    Write several small CSV tables back to back: each is rendered fully in memory
+    and written with a single call, instead of one buffered writer per file.
+    """
+    for path, rows, fieldnames in tables:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("".join(iter_csv_chunks(rows, fieldnames)), encoding="utf-8", newline="")
+
 
+class BackgroundWriter:
+    """
+    Write text chunks to `path` from a background thread fed by a bounded queue,
+    so producing the next chunk overlaps with writing (and compressing) the last.
+    A .gz path is gzip-compressed. Errors on the writer thread are re-raised in
+    the producer on the next write() or on close().
 
-def write_jsonl(path: Path, rows: List[Dict[str, Any]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        for r in rows:
-            f.write(json.dumps(r, ensure_ascii=False) + "\n")
+    Text goes to `<name>.tmp`, which replaces `path` only on close(); if the
+    `with` block raises, discard() deletes it and `path` is left untouched.
+    """
+
+    def __init__(self, path: Path, max_pending: int = 8) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._tmp_path = path.with_name(path.name + ".tmp")
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=max_pending)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name=f"write-{path.name}", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def _run(self) -> None:
+        done = False
+        try:
+            with self._tmp_path.open("wb") as raw:
+                if self.path.suffix == ".gz":
+                    # filename= keeps the final name (not .tmp) in the gzip header
+                    gz = gzip.GzipFile(filename=self.path.name, mode="wb", compresslevel=6, fileobj=raw)
+                    f = io.TextIOWrapper(gz, encoding="utf-8")
+                else:
+                    f = io.TextIOWrapper(raw, encoding="utf-8")
+                with f:
+                    while True:
+                        chunk = self._queue.get()
+                        if chunk is None:
+                            done = True
+                            break
+                        f.write(chunk)
+        except BaseException as e:
+            self._error = e
+            # Keep draining so the producer never blocks on a full queue
+            while not done:
+                done = self._queue.get() is None
+
+    def write(self, chunk: str) -> None:
+        if self._error is not None:
+            raise self._error
+        self._queue.put(chunk)
+
+    def _stop(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def close(self) -> None:
+        self._stop()
+        if self._error is not None:
+            self._tmp_path.unlink(missing_ok=True)
+            raise self._error
+        os.replace(self._tmp_path, self.path)
+
+    def discard(self) -> None:
+        try:
+            self._stop()
+        finally:
+            self._tmp_path.unlink(missing_ok=True)
 
 
 def main() -> int:
@@ -359,7 +599,21 @@ def main() -> int:
     parser.add_argument("--assets-per-plant", type=int, default=10, help="Assets per plant (default: 10)")
     parser.add_argument("--sample-minutes", type=int, default=15, help="Sensor sampling interval in minutes (default: 15)")
     parser.add_argument("--bad-rate", type=float, default=0.015, help="Fraction of bad sensor rows (default: 0.015)")
+    parser.add_argument(
+        "--sensor-format",
+        choices=["jsonl", "jsonl.gz"],
+        default="jsonl",
+        help="Sensor readings file format; jsonl.gz is gzip-compressed (default: jsonl)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes for sensor generation; >1 seeds one stream per asset chunk, so data differs from 1 (default: 1)",
+    )
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     day = date.today() if not args.date else datetime.strptime(args.date, "%Y-%m-%d").date()
     rng = random.Random(args.seed)
@@ -370,43 +624,43 @@ def main() -> int:
     plants = generate_plants(rng, n=args.plants)
     assets = generate_assets(rng, plants=plants, assets_per_plant=args.assets_per_plant)
 
-    sensor_rows, sensor_counters = generate_sensor_readings(
-        rng, assets=assets, day=day, sample_minutes=args.sample_minutes, bad_rate=args.bad_rate
-    )
-    wo_rows = generate_work_orders(rng, assets=assets, day=day)
-    insp_rows = generate_quality_inspections(rng, plants=plants, day=day)
-
-    # Write plants/assets
-    write_csv(
-        out_dir / "plants.csv",
-        [p.__dict__ for p in plants],
-        fieldnames=["plant_id", "plant_name", "country", "timezone", "line_count"],
-    )
-    write_csv(
-        out_dir / "assets.csv",
-        [a.__dict__ for a in assets],
-        fieldnames=["asset_id", "plant_id", "asset_type", "manufacturer", "model", "install_date", "criticality", "maintenance_strategy"],
-    )
+    wo_fields = [
+        "wo_id", "asset_id", "created_ts_utc", "closed_ts_utc", "wo_type", "priority", "status",
+        "technician_team", "downtime_minutes", "parts_cost_eur", "failure_mode_code", "root_cause_code"
+    ]
+    insp_fields = [
+        "inspection_id", "plant_id", "line_id", "ts_utc", "product_family", "batch_id", "result", "defect_code", "defect_severity"
+    ]
 
-    # Write work orders / inspections
-    write_csv(
-        out_dir / "work_orders.csv",
-        wo_rows,
-        fieldnames=[
-            "wo_id", "asset_id", "created_ts_utc", "closed_ts_utc", "wo_type", "priority", "status",
-            "technician_team", "downtime_minutes", "parts_cost_eur", "failure_mode_code", "root_cause_code"
-        ],
-    )
-    write_csv(
-        out_dir / "quality_inspections.csv",
-        insp_rows,
-        fieldnames=[
-            "inspection_id", "plant_id", "line_id", "ts_utc", "product_family", "batch_id", "result", "defect_code", "defect_severity"
-        ],
-    )
+    # Sensor readings as JSONL (keeps nulls, flexible schema). They are written on a
+    # background thread while the main thread keeps generating; the writer stays open
+    # through the remaining generation and the small CSVs, then is drained on close.
+    with BackgroundWriter(out_dir / f"sensor_readings.{args.sensor_format}") as sensor_out:
+        sensor_counters = generate_sensor_readings(
+            rng,
+            assets=assets,
+            day=day,
+            sample_minutes=args.sample_minutes,
+            bad_rate=args.bad_rate,
+            out=sensor_out.write,
+            workers=args.workers,
+        )
+        wo_rows = generate_work_orders(rng, assets=assets, day=day)
+        insp_rows = generate_quality_inspections(rng, plants=plants, day=day)
+
+        # Plants/assets + work orders/inspections are small: each is written in one call
+        write_csv_tables(
+            [
+                (out_dir / "plants.csv", plants, Plant._fields),
+                (out_dir / "assets.csv", assets, Asset._fields),
+                (out_dir / "work_orders.csv", row_values(wo_rows, wo_fields), wo_fields),
+                (out_dir / "quality_inspections.csv", row_values(insp_rows, insp_fields), insp_fields),
+            ]
+        )
 
-    # Sensor readings as JSONL (keeps nulls, flexible schema)
-    write_jsonl(out_dir / "sensor_readings.jsonl", sensor_rows)
+    # Drop the other format left by an earlier run, so readers never pick up stale data
+    other_format = "jsonl.gz" if args.sensor_format == "jsonl" else "jsonl"
+    (out_dir / f"sensor_readings.{other_format}").unlink(missing_ok=True)
 
     meta = {
         "generated_for_date": day.strftime("%Y-%m-%d"),
@@ -415,10 +669,11 @@ def main() -> int:
         "assets_per_plant": args.assets_per_plant,
         "sample_minutes": args.sample_minutes,
         "bad_rate": args.bad_rate,
+        "workers": args.workers,
         "counts": {
             "plants": len(plants),
             "assets": len(assets),
-            "sensor_rows": len(sensor_rows),
+            "sensor_rows": sensor_counters["total"],
             "work_orders": len(wo_rows),
             "quality_inspections": len(insp_rows),
         },
@@ -3,7 +3,7 @@
 Silver -> Gold curated outputs.
 
 Reads:
-- lake/silver/YYYY-MM-DD/sensor_readings_clean.csv
+- lake/silver/YYYY-MM-DD/sensor_readings_clean.csv (or sensor_readings_clean.csv.gz)
 
 Writes:
 - lake/gold/YYYY-MM-DD/plant_kpis.csv
@@ -17,11 +17,43 @@ from __future__ import annotations
 
 import argparse
 import csv
+import gzip
+import io
 import math
-from collections import defaultdict
+import os
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+# Silver columns used for gold aggregation, in the order iter_silver() yields them
+SILVER_COLUMNS = (
+    "asset_id",
+    "operating_state",
+    "temperature_c",
+    "vibration_mm_s",
+    "rpm",
+)
+
+# Bytes per read() from the silver input
+READ_BUFFER_BYTES = 1 << 20
+
+# Write buffer for gold CSVs; a day's gold file fits, so it goes out in one write()
+WRITE_BUFFER_BYTES = 1 << 20
 
 
 def parse_args() -> argparse.Namespace:
@@ -34,276 +66,444 @@ def parse_args() -> argparse.Namespace:
     return p.parse_args()
 
 
-def to_float(x: Any, default: float = float("nan")) -> float:
-    try:
-        return float(x)
-    except Exception:
-        return default
+class AssetInfo(NamedTuple):
+    """Asset attributes joined onto gold rows from bronze assets.csv."""
 
+    plant_id: str
+    asset_type: str
+    criticality: str
+    maintenance_strategy: str
 
-def to_int(x: Any, default: int = 0) -> int:
-    try:
-        return int(float(x))
-    except Exception:
-        return default
 
+UNKNOWN_ASSET = AssetInfo("UNKNOWN", "UNKNOWN", "UNKNOWN", "UNKNOWN")
 
-def safe_mean(values: List[float]) -> float:
-    vals = [v for v in values if not math.isnan(v)]
-    return sum(vals) / len(vals) if vals else float("nan")
 
+class AssetHealthRow(NamedTuple):
+    """One row of asset_health_daily.csv (fields in column order; "" = no data)."""
 
-def safe_max(values: List[float]) -> float:
-    vals = [v for v in values if not math.isnan(v)]
-    return max(vals) if vals else float("nan")
+    date: str
+    plant_id: str
+    asset_id: str
+    asset_type: str
+    criticality: str
+    maintenance_strategy: str
+    readings: int
+    running_ratio: Any
+    temperature_c_mean: Any
+    vibration_mm_s_mean: Any
+    vibration_mm_s_max: Any
+    rpm_mean: Any
+    health_score: Any
 
 
-def load_assets_map(bronze_date_dir: Path) -> Dict[str, Dict[str, str]]:
+class PlantKpiRow(NamedTuple):
+    """One row of plant_kpis.csv (fields in column order; "" = no data)."""
+
+    date: str
+    plant_id: str
+    assets_count: int
+    total_readings: int
+    avg_running_ratio: Any
+    avg_temperature_c: Any
+    avg_vibration_mm_s: Any
+    avg_health_score: Any
+
+
+class AssetStats:
+    """
+    Running per-asset totals, updated one reading at a time; NaN readings are left
+    out of the sums, counts and max. Memory stays O(assets), not O(readings).
+    """
+
+    __slots__ = (
+        "readings",
+        "running",
+        "temp_sum",
+        "temp_n",
+        "vib_sum",
+        "vib_n",
+        "vib_max",
+        "rpm_sum",
+    )
+
+    def __init__(self) -> None:
+        self.readings = 0
+        self.running = 0
+        self.temp_sum = 0.0
+        self.temp_n = 0
+        self.vib_sum = 0.0
+        self.vib_n = 0
+        self.vib_max = -math.inf
+        self.rpm_sum = 0.0
+
+
+class PlantStats:
+    """
+    Running per-plant totals over the plant's asset rows. Every asset has a
+    running ratio and health score, so those average over `assets`; temperature
+    and vibration means keep their own counts since they can be missing.
+    """
+
+    __slots__ = (
+        "assets",
+        "readings",
+        "run_sum",
+        "health_sum",
+        "temp_sum",
+        "temp_n",
+        "vib_sum",
+        "vib_n",
+    )
+
+    def __init__(self) -> None:
+        self.assets = 0
+        self.readings = 0
+        self.run_sum = 0.0
+        self.health_sum = 0.0
+        self.temp_sum = 0.0
+        self.temp_n = 0
+        self.vib_sum = 0.0
+        self.vib_n = 0
+
+
+def load_assets_map(bronze_date_dir: Path) -> Dict[str, AssetInfo]:
     """
     Load assets.csv from the bronze folder to map asset_id -> plant_id, asset_type, criticality, etc.
     This is a simple join for demo purposes.
+    Only the joined columns are kept, already stripped and defaulted to "UNKNOWN".
     """
     assets_path = bronze_date_dir / "assets.csv"
     if not assets_path.exists():
         return {}
 
-    m: Dict[str, Dict[str, str]] = {}
+    m: Dict[str, AssetInfo] = {}
     with assets_path.open("r", encoding="utf-8") as f:
         r = csv.DictReader(f)
         for row in r:
             asset_id = (row.get("asset_id") or "").strip()
             if asset_id:
-                m[asset_id] = row
+                m[asset_id] = AssetInfo(
+                    *[(row.get(k) or "UNKNOWN").strip() for k in AssetInfo._fields]
+                )
     return m
 
 
-def load_silver(path: Path) -> List[Dict[str, str]]:
-    rows: List[Dict[str, str]] = []
-    with path.open("r", encoding="utf-8") as f:
-        r = csv.DictReader(f)
-        for row in r:
-            rows.append(row)
-    return rows
+def or_blank(value: float) -> Any:
+    """Value as published in a gold CSV: NaN (no data) becomes an empty cell."""
+    return "" if math.isnan(value) else value
+
+
+def health_score(vib_mean: float, temp_mean: float) -> float:
+    """
+    Simple "health score" heuristic for demo: higher vibration reduces score.
+    Score is not a real model; it shows how you’d publish a business-ready metric.
+    A NaN mean (no readings) adds no penalty.
+    """
+    score = 100.0
+    if not math.isnan(vib_mean):
+        score -= min(40.0, vib_mean * 8.0)
+    # mild penalty for high temps (NaN > 80 is False, so no separate NaN check)
+    if temp_mean > 80:
+        score -= min(20.0, (temp_mean - 80) * 0.5)
+    return max(0.0, min(100.0, score))
+
+
+class StripCache(dict):
+    """Maps a raw value to its stripped form ("" for None), computed once per key."""
+
+    def __missing__(self, raw: Optional[str]) -> str:
+        value = self[raw] = (raw or "").strip()
+        return value
+
+
+# Asset code for rows with a missing or blank asset_id
+NO_ASSET = -1
+
+
+class AssetCodes(dict):
+    """
+    Dictionary encoding for asset_id: maps a raw value to an int code, and
+    ids[code] is the stripped asset_id. Codes follow first appearance; a missing
+    or blank asset_id encodes as NO_ASSET. Each raw value is resolved once.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.ids: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def __missing__(self, raw: Optional[str]) -> int:
+        asset_id = (raw or "").strip()
+        if not asset_id:
+            code = NO_ASSET
+        else:
+            code = self._codes.get(asset_id)
+            if code is None:
+                code = self._codes[asset_id] = len(self.ids)
+                self.ids.append(asset_id)
+        self[raw] = code
+        return code
 
 
-def write_csv(path: Path, fieldnames: List[str], rows: List[Dict[str, Any]]) -> None:
+def iter_silver(path: Path, asset_ids: AssetCodes) -> Iterator[Tuple[Any, ...]]:
+    """
+    Yield only the SILVER_COLUMNS of the silver CSV, one value tuple per row,
+    without holding the file or the rows in memory.
+    Columns are picked by header position, so no per-row dict is built; a missing
+    column or short row reads as None. Lines without a quote character are split
+    directly (str.split), and only quoted records go through csv.reader.
+
+    asset_id and operating_state repeat on every row, so they are
+    dictionary-encoded: asset_id becomes an int code from asset_ids (whose .ids
+    maps codes back) and operating_state is stripped once per distinct value
+    ("" if missing).
+    """
+    states = StripCache()
+    with path.open("rb", buffering=READ_BUFFER_BYTES) as raw:
+        if hasattr(os, "posix_fadvise"):
+            # Sequential hint: the kernel widens readahead so reads rarely block
+            os.posix_fadvise(raw.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if path.suffix == ".gz":
+            f = gzip.open(raw, "rt", encoding="utf-8")
+        else:
+            f = io.TextIOWrapper(raw, encoding="utf-8")
+        with f:
+            header = next(csv.reader(f), None)
+            if header is None:
+                return
+            # Last occurrence wins for a repeated header name, as with csv.DictReader.
+            # A missing column gets an index no row reaches, so it always reads as None.
+            pos = {name: i for i, name in enumerate(header)}
+            idx = [pos.get(name, sys.maxsize) for name in SILVER_COLUMNS]
+            i_asset, i_state, i_temp, i_vib, i_rpm = idx
+            for line in f:
+                if '"' in line:
+                    # Quoted values (which may span lines): csv parses this record,
+                    # pulling any continuation lines from the same file iterator
+                    row = next(csv.reader(chain((line,), f)))
+                else:
+                    # Plain record: splitting on "," gives what csv.reader would
+                    line = line.rstrip("\n")
+                    if not line:
+                        continue
+                    row = line.split(",")
+                try:
+                    values = (
+                        asset_ids[row[i_asset]],
+                        states[row[i_state]],
+                        row[i_temp],
+                        row[i_vib],
+                        row[i_rpm],
+                    )
+                except IndexError:
+                    n = len(row)
+                    asset_id, state, *rest = [row[i] if i < n else None for i in idx]
+                    values = (asset_ids[asset_id], states[state], *rest)
+                yield values
+
+
+def aggregate_assets(rows: Iterable[Tuple[Any, ...]]) -> List[AssetStats]:
+    """
+    Fold iter_silver() rows into one AssetStats per asset code, as they stream
+    in. Codes are handed out consecutively, so an unseen code is always the next
+    list index.
+
+    This is the per-row hot loop, specialised by hand: values are parsed with
+    an inline try/float(), and anything float() rejects (blank, garbage) counts
+    as NaN; globals are bound to locals once. NaN is filtered with a
+    self-comparison (x == x is False only for NaN) rather than a math.isnan()
+    call per value.
+    """
+    per_asset: List[AssetStats] = []
+    no_asset = NO_ASSET
+    nan = float("nan")
+
+    for code, state, temperature, vibration, rpm in rows:
+        if code == no_asset:
+            continue
+
+        try:
+            stats = per_asset[code]
+        except IndexError:
+            stats = AssetStats()
+            per_asset.append(stats)
+        stats.readings += 1
+        if state == "running":
+            stats.running += 1
+
+        try:
+            t = float(temperature)
+        except Exception:
+            t = nan
+        if t == t:
+            stats.temp_sum += t
+            stats.temp_n += 1
+        try:
+            v = float(vibration)
+        except Exception:
+            v = nan
+        if v == v:
+            stats.vib_sum += v
+            stats.vib_n += 1
+            if v > stats.vib_max:
+                stats.vib_max = v
+        # rpm is truncated to a whole number (int(float(x))), 0 if unparseable: never
+        # NaN, so every reading counts towards rpm_mean
+        try:
+            r = float(int(float(rpm)))
+        except Exception:
+            r = 0.0
+        stats.rpm_sum += r
+
+    return per_asset
+
+
+def write_csv(
+    path: Path, fieldnames: Sequence[str], rows: Iterable[Sequence[Any]]
+) -> None:
+    """Write rows given as value tuples in fieldnames order."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for row in rows:
-            w.writerow(row)
+    with path.open(
+        "w", buffering=WRITE_BUFFER_BYTES, newline="", encoding="utf-8"
+    ) as f:
+        w = csv.writer(f)
+        w.writerow(fieldnames)
+        w.writerows(rows)
 
 
 def main() -> int:
     args = parse_args()
     date_str = args.date
 
-    silver_path = Path("lake") / "silver" / date_str / "sensor_readings_clean.csv"
+    silver_dir = Path("lake") / "silver" / date_str
+    silver_path = silver_dir / "sensor_readings_clean.csv"
+    gz_path = silver_dir / "sensor_readings_clean.csv.gz"
+    if silver_path.exists() and gz_path.exists():
+        raise FileExistsError(
+            f"Both {silver_path} and {gz_path} exist; remove the stale one"
+        )
     if not silver_path.exists():
-        raise FileNotFoundError(f"Missing input: {silver_path}")
+        if not gz_path.exists():
+            raise FileNotFoundError(f"Missing input: {silver_path}")
+        silver_path = gz_path
 
     # For a nicer demo, join with bronze assets to get plant_id + asset_type
     bronze_date_dir = Path("lake") / "bronze" / date_str
     assets_map = load_assets_map(bronze_date_dir)
 
-    rows = load_silver(silver_path)
+    asset_codes = AssetCodes()
 
     # ---- Aggregate per asset ----
     # We'll compute daily summaries used in dashboards / KPI reporting.
-    per_asset: Dict[str, Dict[str, Any]] = {}
-    per_asset_lists: Dict[str, Dict[str, List[float]]] = defaultdict(
-        lambda: defaultdict(list)
-    )
-
-    running_counts: Dict[str, int] = defaultdict(int)
-    total_counts: Dict[str, int] = defaultdict(int)
-
-    for r in rows:
-        asset_id = (r.get("asset_id") or "").strip()
-        if not asset_id:
-            continue
-
-        total_counts[asset_id] += 1
-        if (r.get("operating_state") or "").strip() == "running":
-            running_counts[asset_id] += 1
-
-        per_asset_lists[asset_id]["temperature_c"].append(
-            to_float(r.get("temperature_c"))
-        )
-        per_asset_lists[asset_id]["vibration_mm_s"].append(
-            to_float(r.get("vibration_mm_s"))
-        )
-        per_asset_lists[asset_id]["pressure_bar"].append(
-            to_float(r.get("pressure_bar"))
-        )
-        per_asset_lists[asset_id]["flow_l_min"].append(to_float(r.get("flow_l_min")))
-        per_asset_lists[asset_id]["rpm"].append(float(to_int(r.get("rpm"))))
-
-    asset_health_rows: List[Dict[str, Any]] = []
-    for asset_id, metrics in per_asset_lists.items():
-        ainfo = assets_map.get(asset_id, {})
-        plant_id = (ainfo.get("plant_id") or "UNKNOWN").strip()
-        asset_type = (ainfo.get("asset_type") or "UNKNOWN").strip()
-        criticality = (ainfo.get("criticality") or "UNKNOWN").strip()
-        strategy = (ainfo.get("maintenance_strategy") or "UNKNOWN").strip()
-
-        temp_mean = safe_mean(metrics["temperature_c"])
-        vib_mean = safe_mean(metrics["vibration_mm_s"])
-        vib_max = safe_max(metrics["vibration_mm_s"])
-        rpm_mean = safe_mean(metrics["rpm"])
-
-        run_ratio = (
-            (running_counts[asset_id] / total_counts[asset_id])
-            if total_counts[asset_id]
-            else 0.0
+    # Rows stream from the file straight into per-asset totals
+    per_asset = aggregate_assets(iter_silver(silver_path, asset_codes))
+
+    # ---- Asset health rows, rolled up per plant in the same pass ----
+    nan = float("nan")
+    asset_health_rows: List[AssetHealthRow] = []
+    per_plant: Dict[str, PlantStats] = {}
+    for asset_id, stats in zip(asset_codes.ids, per_asset):
+        plant_id, asset_type, criticality, strategy = assets_map.get(
+            asset_id, UNKNOWN_ASSET
         )
 
-        # Simple "health score" heuristic for demo: higher vibration reduces score
-        # Score is not a real model; it shows how you’d publish a business-ready metric.
-        health_score = 100.0
-        if not math.isnan(vib_mean):
-            health_score -= min(40.0, vib_mean * 8.0)
-        if not math.isnan(temp_mean):
-            # mild penalty for high temps
-            if temp_mean > 80:
-                health_score -= min(20.0, (temp_mean - 80) * 0.5)
+        readings = stats.readings
+        temp_mean = stats.temp_sum / stats.temp_n if stats.temp_n else nan
+        vib_mean = stats.vib_sum / stats.vib_n if stats.vib_n else nan
+        vib_max = stats.vib_max if stats.vib_n else nan
+        rpm_mean = stats.rpm_sum / readings
 
-        health_score = max(0.0, min(100.0, health_score))
+        running_ratio = round(stats.running / readings, 3)
+        # round() keeps NaN as NaN; or_blank() publishes it as ""
+        temp_c = round(temp_mean, 2)
+        vib_c = round(vib_mean, 3)
+        score = round(health_score(vib_mean, temp_mean), 1)
 
         asset_health_rows.append(
-            {
-                "date": date_str,
-                "plant_id": plant_id,
-                "asset_id": asset_id,
-                "asset_type": asset_type,
-                "criticality": criticality,
-                "maintenance_strategy": strategy,
-                "readings": total_counts[asset_id],
-                "running_ratio": round(run_ratio, 3),
-                "temperature_c_mean": (
-                    round(temp_mean, 2) if not math.isnan(temp_mean) else ""
-                ),
-                "vibration_mm_s_mean": (
-                    round(vib_mean, 3) if not math.isnan(vib_mean) else ""
-                ),
-                "vibration_mm_s_max": (
-                    round(vib_max, 3) if not math.isnan(vib_max) else ""
-                ),
-                "rpm_mean": round(rpm_mean, 0) if not math.isnan(rpm_mean) else "",
-                "health_score": round(health_score, 1),
-            }
-        )
-
-    # ---- Aggregate per plant ----
-    plant_lists: Dict[str, Dict[str, List[float]]] = defaultdict(
-        lambda: defaultdict(list)
-    )
-    plant_assets: Dict[str, set] = defaultdict(set)
-    plant_total_readings: Dict[str, int] = defaultdict(int)
-
-    for row in asset_health_rows:
-        plant_id = row["plant_id"]
-        plant_assets[plant_id].add(row["asset_id"])
-        plant_total_readings[plant_id] += int(row["readings"])
-        if row["health_score"] != "":
-            plant_lists[plant_id]["health_score"].append(float(row["health_score"]))
-        if row["vibration_mm_s_mean"] != "":
-            plant_lists[plant_id]["vibration_mm_s_mean"].append(
-                float(row["vibration_mm_s_mean"])
+            AssetHealthRow(
+                date=date_str,
+                plant_id=plant_id,
+                asset_id=asset_id,
+                asset_type=asset_type,
+                criticality=criticality,
+                maintenance_strategy=strategy,
+                readings=readings,
+                running_ratio=running_ratio,
+                temperature_c_mean=or_blank(temp_c),
+                vibration_mm_s_mean=or_blank(vib_c),
+                vibration_mm_s_max=or_blank(round(vib_max, 3)),
+                rpm_mean=or_blank(round(rpm_mean, 0)),
+                health_score=score,
             )
-        if row["temperature_c_mean"] != "":
-            plant_lists[plant_id]["temperature_c_mean"].append(
-                float(row["temperature_c_mean"])
-            )
-        if row["running_ratio"] != "":
-            plant_lists[plant_id]["running_ratio"].append(float(row["running_ratio"]))
+        )
 
-    plant_kpis_rows: List[Dict[str, Any]] = []
-    for plant_id, lists in plant_lists.items():
+        # Plant KPIs average the published (rounded) asset values
+        plant = per_plant.get(plant_id)
+        if plant is None:
+            plant = per_plant[plant_id] = PlantStats()
+        plant.assets += 1
+        plant.readings += readings
+        plant.run_sum += running_ratio
+        plant.health_sum += score
+        if not math.isnan(temp_c):
+            plant.temp_sum += temp_c
+            plant.temp_n += 1
+        if not math.isnan(vib_c):
+            plant.vib_sum += vib_c
+            plant.vib_n += 1
+
+    plant_kpis_rows: List[PlantKpiRow] = []
+    for plant_id, plant in per_plant.items():
         plant_kpis_rows.append(
-            {
-                "date": date_str,
-                "plant_id": plant_id,
-                "assets_count": len(plant_assets[plant_id]),
-                "total_readings": plant_total_readings[plant_id],
-                "avg_running_ratio": (
-                    round(safe_mean(lists["running_ratio"]), 3)
-                    if lists["running_ratio"]
-                    else ""
+            PlantKpiRow(
+                date=date_str,
+                plant_id=plant_id,
+                assets_count=plant.assets,
+                total_readings=plant.readings,
+                avg_running_ratio=round(plant.run_sum / plant.assets, 3),
+                avg_temperature_c=(
+                    round(plant.temp_sum / plant.temp_n, 2) if plant.temp_n else ""
                 ),
-                "avg_temperature_c": (
-                    round(safe_mean(lists["temperature_c_mean"]), 2)
-                    if lists["temperature_c_mean"]
-                    else ""
+                avg_vibration_mm_s=(
+                    round(plant.vib_sum / plant.vib_n, 3) if plant.vib_n else ""
                 ),
-                "avg_vibration_mm_s": (
-                    round(safe_mean(lists["vibration_mm_s_mean"]), 3)
-                    if lists["vibration_mm_s_mean"]
-                    else ""
-                ),
-                "avg_health_score": (
-                    round(safe_mean(lists["health_score"]), 2)
-                    if lists["health_score"]
-                    else ""
-                ),
-            }
+                avg_health_score=round(plant.health_sum / plant.assets, 2),
+            )
         )
 
     # Output paths
     gold_dir = Path("lake") / "gold" / date_str
     exports_dir = Path("exports") / date_str
 
-    write_csv(
-        gold_dir / "asset_health_daily.csv",
-        fieldnames=[
-            "date",
-            "plant_id",
-            "asset_id",
-            "asset_type",
-            "criticality",
-            "maintenance_strategy",
-            "readings",
-            "running_ratio",
-            "temperature_c_mean",
-            "vibration_mm_s_mean",
-            "vibration_mm_s_max",
-            "rpm_mean",
-            "health_score",
-        ],
-        rows=sorted(asset_health_rows, key=lambda r: (r["plant_id"], r["asset_id"])),
-    )
-
-    write_csv(
-        gold_dir / "plant_kpis.csv",
-        fieldnames=[
-            "date",
-            "plant_id",
-            "assets_count",
-            "total_readings",
-            "avg_running_ratio",
-            "avg_temperature_c",
-            "avg_vibration_mm_s",
-            "avg_health_score",
-        ],
-        rows=sorted(plant_kpis_rows, key=lambda r: r["plant_id"]),
-    )
-
-    # Copy one output to exports/ for easy viewing
-    write_csv(
-        exports_dir / "plant_kpis.csv",
-        fieldnames=[
-            "date",
-            "plant_id",
-            "assets_count",
-            "total_readings",
-            "avg_running_ratio",
-            "avg_temperature_c",
-            "avg_vibration_mm_s",
-            "avg_health_score",
-        ],
-        rows=sorted(plant_kpis_rows, key=lambda r: r["plant_id"]),
-    )
+    # Sort in place with C-level key getters (no lambda call per row)
+    asset_health_rows.sort(key=attrgetter("plant_id", "asset_id"))
+    plant_kpis_rows.sort(key=attrgetter("plant_id"))
+
+    # The two gold files are independent; write them concurrently (file writes
+    # release the GIL)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [
+            pool.submit(
+                write_csv,
+                gold_dir / "asset_health_daily.csv",
+                AssetHealthRow._fields,
+                asset_health_rows,
+            ),
+            pool.submit(
+                write_csv,
+                gold_dir / "plant_kpis.csv",
+                PlantKpiRow._fields,
+                plant_kpis_rows,
+            ),
+        ]
+        for fut in futures:
+            fut.result()
+
+    # Copy one output to exports/ for easy viewing. A byte copy (done in the kernel
+    # on Linux) rather than a second write; not a hardlink, so editing the export
+    # cannot change the gold file.
+    exports_dir.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(gold_dir / "plant_kpis.csv", exports_dir / "plant_kpis.csv")
 
     print(f"Read silver: {silver_path}")
     print(f"Gold plant KPIs: {gold_dir / 'plant_kpis.csv'}")